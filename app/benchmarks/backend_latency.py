@@ -0,0 +1,97 @@
+"""
+Compares page latency when serving from mysql and from a sqlite snapshot of the
+same data. Loads the fixture games into the configured mysql database if they
+are not there yet, so point the MYSQL_* settings at a scratch database. Run from
+the app directory with `python -m benchmarks.backend_latency`.
+"""
+import json
+import os
+import statistics
+import tempfile
+import time
+from fastapi.testclient import TestClient
+from requests.models import Response
+from sqlalchemy.orm import Session
+from typing import Dict, List
+from etl.parser import parse_load_game
+from sql.models import Base, GameORM, PlayerORM, TeamORM
+from sql.snapshot import export_snapshot
+from sql.utils import make_engine
+
+FIXTURES = ["tests/data/2021-06-12-DAL-AUS.json"]
+REQUESTS_PER_PAGE = 50
+
+
+def load_fixtures(engine) -> None:
+    Base.metadata.create_all(engine)
+    for path in FIXTURES:
+        with open(path, "rb") as f:
+            content = f.read()
+        ext_game_id = json.loads(content)["game"]["ext_game_id"]
+        with Session(engine) as session:
+            if session.query(GameORM).filter_by(ext_game_id=ext_game_id).first():
+                continue
+        response = Response()
+        response._content = content
+        parse_load_game(engine, response)
+
+
+def pages(engine) -> List[str]:
+    with Session(engine) as session:
+        game = session.query(GameORM).first()
+        team = session.query(TeamORM).first()
+        player = session.query(PlayerORM).first()
+    return [
+        "/teams/view",
+        f"/teams/{team.id}/view",
+        "/games/view_all",
+        f"/games/{game.id}/view",
+        f"/players/{player.id}/view",
+        f"/teams/{team.id}/passes",
+        f"/games/{game.id}/score_timeline",
+        f"/heatmaps/team/{team.id}?format=json",
+    ]
+
+
+def time_pages(urls: List[str]) -> Dict[str, List[float]]:
+    """
+    Starts the app against whichever backend the environment selects and
+    returns request latencies in ms per url.
+    """
+    import main
+
+    timings = {}
+    with TestClient(main.app) as client:
+        main.app.state.engine.echo = False
+        for url in urls:
+            client.get(url)  # Warm up
+            timings[url] = []
+            for _ in range(REQUESTS_PER_PAGE):
+                started = time.perf_counter()
+                client.get(url).raise_for_status()
+                timings[url].append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+if __name__ == "__main__":
+    mysql = make_engine(echo=False)
+    load_fixtures(mysql)
+    urls = pages(mysql)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = os.path.join(tmp, "snapshot.sqlite")
+        export_snapshot(mysql, snapshot)
+
+        os.environ["SQLITE_SNAPSHOT"] = ""
+        results = {"mysql": time_pages(urls)}
+        os.environ["SQLITE_SNAPSHOT"] = snapshot
+        results["sqlite"] = time_pages(urls)
+
+    print(f"{'page':<45} {'mysql p50/p95 ms':>18} {'sqlite p50/p95 ms':>18}")
+    for url in urls:
+        cells = []
+        for backend in ["mysql", "sqlite"]:
+            times = sorted(results[backend][url])
+            p95 = times[int(len(times) * 0.95) - 1]
+            cells.append(f"{statistics.median(times):7.1f} / {p95:7.1f}")
+        print(f"{url[:45]:<45} {cells[0]:>18} {cells[1]:>18}")
@@ -0,0 +1,66 @@
+"""
+Measures cold import time of the web app and the ETL loader in fresh
+interpreters, which is what a gunicorn worker or the loader container pays on
+boot. Run from the app directory with `python -m benchmarks.startup`.
+"""
+import statistics
+import subprocess
+import sys
+from typing import List
+
+MODULES = ["main", "etl.batch_load"]
+RUNS = 5
+TOP_IMPORTS = 10
+
+TIMER = (
+    "import time; t = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def time_import(module: str) -> float:
+    """
+    Returns the seconds taken to import a module in a fresh interpreter.
+    """
+    out = subprocess.run(
+        [sys.executable, "-c", TIMER.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(module: str, n: int) -> List[str]:
+    """
+    Returns the n slowest top-level imports by cumulative time from
+    `python -X importtime`.
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Only direct imports of the measured module (one level of nesting)
+        if len(name) - len(name.lstrip()) != 3:
+            continue
+        rows.append((int(cumulative), name.strip()))
+    rows.sort(reverse=True)
+    return [f"{us / 1000:8.1f} ms  {name}" for us, name in rows[:n]]
+
+
+if __name__ == "__main__":
+    for module in MODULES:
+        times = [time_import(module) * 1000 for _ in range(RUNS)]
+        print(
+            f"import {module}: median {statistics.median(times):.0f} ms, "
+            f"min {min(times):.0f} ms over {RUNS} runs"
+        )
+        for row in slowest_imports(module, TOP_IMPORTS):
+            print(f"    {row}")
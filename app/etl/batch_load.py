@@ -2,8 +2,8 @@
 Identify game URLs not already loaded and load them into mysql db. 
 """
 
+import csv
 import requests
-import pandas as pd
 from sqlalchemy.orm.session import Session
 from etl.parser import parse_load_game
 from sql.utils import make_engine
@@ -15,8 +15,11 @@ if __name__ == "__main__":
 
     session = Session(engine)
 
-    game_urls = pd.read_csv("etl/urls_2021.csv", skiprows=0)
-    for game_url in game_urls.values:
+    with open("etl/urls_2021.csv", newline="") as f:
+        reader = csv.reader(f)
+        next(reader)  # Skip header
+        game_urls = [row for row in reader if row]
+    for game_url in game_urls:
         ext_game_id = game_url[0].split("/")[-1]
         print(f"Checking for game {ext_game_id}")
         # Check if game is already loaded
@@ -0,0 +1,27 @@
+"""
+One-off script to rebuild all heat maps from the events already in the database.
+"""
+
+from sqlalchemy.orm import Session
+from etl.heatmaps import accumulate_heatmaps, merge_heatmaps
+from sql.models import EventORM, GameORM, HeatMapORM
+from sql.utils import make_engine
+
+
+if __name__ == "__main__":
+    engine = make_engine(echo=False)
+
+    with Session(engine) as session:
+        session.query(HeatMapORM).delete()
+        for game in session.query(GameORM).all():
+            print(f"Binning events for game {game.ext_game_id}")
+            events = (
+                session.query(EventORM)
+                .filter(EventORM.game_id == game.id)
+                .order_by(EventORM.team_id, EventORM.sequence)
+                .all()
+            )
+            merge_heatmaps(
+                session, accumulate_heatmaps(events, game.start_timestamp.year)
+            )
+        session.commit()
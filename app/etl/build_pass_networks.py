@@ -0,0 +1,32 @@
+"""
+One-off script to rebuild all game and season pass networks from the events
+already in the database.
+"""
+
+from sqlalchemy.orm import Session
+from etl.pass_network import accumulate_passes, merge_passes
+from sql.models import EventORM, GameORM, GamePassORM, SeasonPassORM
+from sql.utils import make_engine
+
+
+if __name__ == "__main__":
+    engine = make_engine(echo=False)
+
+    with Session(engine) as session:
+        session.query(GamePassORM).delete()
+        session.query(SeasonPassORM).delete()
+        for game in session.query(GameORM).all():
+            print(f"Building pass networks for game {game.ext_game_id}")
+            events = (
+                session.query(EventORM)
+                .filter(EventORM.game_id == game.id)
+                .order_by(EventORM.team_id, EventORM.sequence)
+                .all()
+            )
+            merge_passes(
+                session,
+                game.id,
+                game.start_timestamp.year,
+                accumulate_passes(events),
+            )
+        session.commit()
@@ -67,3 +67,18 @@ EVENT_TYPES_GENERAL = {
     26: "End of Period",
     27: "End of Period",
 }
+
+# Events that pause play without changing who holds the disc
+POSSESSION_NEUTRAL_EVENTS = {
+    "Timeout",
+    "Opponent Timeout",
+    "Travel",
+    "Opponent Travel",
+    "Opponent Foul",
+    "Own Foul",
+    "Substitutions",
+    "Injury",
+    "Opponent Injury",
+    "Offsides",
+    "Opponent Offsides",
+}
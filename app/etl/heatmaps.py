@@ -0,0 +1,108 @@
+"""
+Binned field-position histograms of completions, throwaways, scores and pulls,
+kept per player, per team and per season.
+"""
+import numpy as np
+from collections import defaultdict
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, Optional, Tuple
+from etl.event_types import POSSESSION_NEUTRAL_EVENTS
+from sql.models import EventORM, HeatMapORM
+
+# Coordinates are in yards: x runs sideline to sideline across the centre of the
+# field, y runs from the back of one endzone to the back of the other.
+FIELD_X_MIN = -26.67
+FIELD_X_MAX = 26.67
+FIELD_Y_MIN = 0.0
+FIELD_Y_MAX = 120.0
+GRID_ROWS = 24  # 5 yards per row along the length of the field
+GRID_COLS = 10  # ~5.3 yards per column across the field
+
+HEATMAP_DTYPE = np.dtype("<i4")
+
+HEATMAP_EVENT_KINDS = {
+    "Completion": "completion",
+    "Throwaway": "throwaway",
+    "Score": "score",
+    "In-bounds Pull": "pull",
+    "Out-of-bounds Pull": "pull",
+}
+
+# (scope, scope_id, season, event_kind)
+HeatMapKey = Tuple[str, str, int, str]
+
+
+def bin_coordinates(x: float, y: float) -> Tuple[int, int]:
+    """
+    Returns the (row, col) grid cell of a field position, clipping positions
+    that fall just outside the field into the edge cells.
+    """
+    row = int((y - FIELD_Y_MIN) / (FIELD_Y_MAX - FIELD_Y_MIN) * GRID_ROWS)
+    col = int((x - FIELD_X_MIN) / (FIELD_X_MAX - FIELD_X_MIN) * GRID_COLS)
+    return min(max(row, 0), GRID_ROWS - 1), min(max(col, 0), GRID_COLS - 1)
+
+
+def accumulate_heatmaps(
+    events: Iterable[EventORM], season: int
+) -> Dict[HeatMapKey, np.ndarray]:
+    """
+    Bins one game's events into per-player and per-team grids. Events must be
+    ordered by sequence within each team, since throwaways carry no player and
+    are credited to the receiver of the previous completion in the same
+    possession. A throwaway with no known thrower only counts for the team.
+    """
+    grids = defaultdict(lambda: np.zeros((GRID_ROWS, GRID_COLS), HEATMAP_DTYPE))
+    last_receiver: Dict[str, Optional[str]] = {}
+
+    for e in events:
+        kind = HEATMAP_EVENT_KINDS.get(e.event_type)
+        if kind and e.coordinate_x is not None and e.coordinate_y is not None:
+            cell = bin_coordinates(e.coordinate_x, e.coordinate_y)
+            grids[("team", e.team_id, season, kind)][cell] += 1
+
+            player_id = e.player_id
+            if e.event_type == "Throwaway":
+                player_id = last_receiver.get(e.team_id)
+            if player_id:
+                grids[("player", player_id, season, kind)][cell] += 1
+
+        # Only a completion in the current possession identifies the thrower
+        if e.event_type == "Completion":
+            last_receiver[e.team_id] = e.player_id
+        elif e.event_type not in POSSESSION_NEUTRAL_EVENTS:
+            last_receiver[e.team_id] = None
+
+    return dict(grids)
+
+
+def decode_counts(heat_map: HeatMapORM) -> np.ndarray:
+    return np.frombuffer(heat_map.counts, dtype=HEATMAP_DTYPE).reshape(
+        heat_map.n_rows, heat_map.n_cols
+    )
+
+
+def merge_heatmaps(session: Session, grids: Dict[HeatMapKey, np.ndarray]) -> None:
+    """
+    Adds grids onto the stored heat maps, creating rows that do not exist yet.
+    Does not commit.
+    """
+    for key, grid in grids.items():
+        heat_map: Optional[HeatMapORM] = session.get(HeatMapORM, key)
+        if heat_map:
+            grid = grid + decode_counts(heat_map)
+            heat_map.counts = grid.astype(HEATMAP_DTYPE).tobytes()
+            heat_map.total = int(grid.sum())
+        else:
+            scope, scope_id, season, event_kind = key
+            session.add(
+                HeatMapORM(
+                    scope=scope,
+                    scope_id=scope_id,
+                    season=season,
+                    event_kind=event_kind,
+                    n_rows=GRID_ROWS,
+                    n_cols=GRID_COLS,
+                    total=int(grid.sum()),
+                    counts=grid.astype(HEATMAP_DTYPE).tobytes(),
+                )
+            )
@@ -0,0 +1,139 @@
+"""
+Polls an in-progress game and appends only the events that are new since the
+last poll. Run from the app directory with
+
+    python -m etl.live <game url> [--interval SECONDS]
+"""
+import argparse
+import json
+import time
+import requests
+from sqlalchemy import func
+from sqlalchemy.engine.base import Engine
+from sqlalchemy.orm import Session
+from requests import Response
+from typing import Dict
+from etl.heatmaps import accumulate_heatmaps, merge_heatmaps
+from etl.parser import parse_events, parse_load_game
+from etl.pass_network import accumulate_passes, merge_passes
+from etl.score_timeline import build_score_timeline, goal_times
+from sql.models import EventORM, GameORM, RosterORM
+from sql.utils import make_engine
+
+
+def _difference(totals: Dict, earlier: Dict) -> Dict:
+    """
+    Returns totals minus earlier per key, dropping keys that did not change.
+    """
+    delta = {}
+    for key, value in totals.items():
+        if key in earlier:
+            value = value - earlier[key]
+        if value.any() if hasattr(value, "any") else value:
+            delta[key] = value
+    return delta
+
+
+def append_live_events(engine: Engine, response: Response) -> int:
+    """
+    Loads the game if it is new, otherwise appends the events past the last
+    stored sequence of each team stream and updates the score, score timeline,
+    heat maps and pass networks. Returns the number of events added.
+    """
+    gamejson = json.loads(response.content.decode())
+    with Session(engine) as session:
+        game = (
+            session.query(GameORM)
+            .filter(GameORM.ext_game_id == gamejson["game"]["ext_game_id"])
+            .first()
+        )
+        if not game:
+            parse_load_game(engine, response)
+            return sum(
+                len(json.loads(gamejson[tsg]["events"] or "[]"))
+                for tsg in ["tsgHome", "tsgAway"]
+            )
+
+        season = game.start_timestamp.year
+        new_events = []
+        heatmap_grids = {}
+        passes = {}
+        for tsg, team_id in [
+            ("tsgHome", game.home_team_id),
+            ("tsgAway", game.away_team_id),
+        ]:
+            last_sequence = (
+                session.query(func.max(EventORM.sequence))
+                .filter(EventORM.game_id == game.id, EventORM.team_id == team_id)
+                .scalar()
+            )
+            stored = -1 if last_sequence is None else last_sequence
+            roster_lookup = {
+                audl_id: player_id
+                for audl_id, player_id in session.query(
+                    RosterORM.audl_id, RosterORM.player_id
+                ).filter(RosterORM.game_id == game.id, RosterORM.team_id == team_id)
+            }
+            events = parse_events(
+                gamejson[tsg]["events"], game.id, team_id, roster_lookup
+            )
+            if len(events) <= stored + 1:
+                continue
+
+            # Derived tables depend on earlier events in the possession, so add
+            # the difference between the full stream and the part already stored
+            new_events += events[stored + 1 :]
+            heatmap_grids.update(
+                _difference(
+                    accumulate_heatmaps(events, season),
+                    accumulate_heatmaps(events[: stored + 1], season),
+                )
+            )
+            passes.update(
+                _difference(
+                    accumulate_passes(events), accumulate_passes(events[: stored + 1])
+                )
+            )
+
+        session.add_all(new_events)
+        game.home_score = gamejson["game"]["score_home"]
+        game.away_score = gamejson["game"]["score_away"]
+        game.live = bool(gamejson["game"]["live"])
+        merge_heatmaps(session, heatmap_grids)
+        merge_passes(session, game.id, season, passes)
+        session.merge(
+            build_score_timeline(
+                game.id,
+                goal_times(gamejson["game"]["score_times_home"]),
+                goal_times(gamejson["game"]["score_times_away"]),
+                live=bool(gamejson["game"]["live"]),
+            )
+        )
+        session.commit()
+        return len(new_events)
+
+
+def poll_live_game(engine: Engine, url: str, interval: float) -> None:
+    """
+    Polls a game until its payload stops reporting it as live.
+    """
+    while True:
+        response = requests.get(url)
+        response.raise_for_status()
+        added = append_live_events(engine, response)
+        print(f"Added {added} events")
+        if not json.loads(response.content.decode())["game"]["live"]:
+            print("Game is no longer live.")
+            break
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("url", help="Stats page url of the game to follow")
+    parser.add_argument("--interval", type=float, default=10.0)
+    args = parser.parse_args()
+
+    poll_live_game(make_engine(echo=False), args.url, args.interval)
@@ -6,7 +6,7 @@ from datetime import datetime
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Session
 from sqlalchemy import insert
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from requests import Response
 from sql.models import (
     GameORM,
@@ -17,6 +17,9 @@ from sql.models import (
     uuid16,
 )
 from etl.event_types import EVENT_TYPES, EVENT_TYPES_GENERAL
+from etl.heatmaps import accumulate_heatmaps, merge_heatmaps
+from etl.pass_network import accumulate_passes, merge_passes
+from etl.score_timeline import build_score_timeline, goal_times
 
 
 def parse_roster(
@@ -108,6 +111,20 @@ def parse_event(
     return e
 
 
+def parse_events(
+    events_json: Optional[str], game_id: str, team_id: str, roster_lookup: dict
+) -> List[EventORM]:
+    """
+    Parses one team's event stream. Sequence numbers are positions in the
+    stream, so re-parsing a longer copy of the same stream yields the same
+    sequence numbers for the events seen before.
+    """
+    return [
+        parse_event(e, game_id, team_id, roster_lookup, event_sequence=sequence)
+        for sequence, e in enumerate(json.loads(events_json or "[]"))
+    ]
+
+
 def parse_load_game(engine: Engine, response: Response) -> None:
     """ """
     ## Get list of all players
@@ -139,40 +156,30 @@ def parse_load_game(engine: Engine, response: Response) -> None:
         ),
         start_timezone=gamejson["game"]["start_timezone"],
         ext_game_id=gamejson["game"]["ext_game_id"],
+        live=bool(gamejson["game"]["live"]),
     )
 
+    # Build a roster lookup for audl_rostered_player_id --> player.id
     home_roster_lookup = {}
     for player_id, vdict in home_roster_dict.items():
         home_roster_lookup[vdict["audl_id"]] = player_id
-    # Build a roster lookup for audl_rostered_player_id --> player.id
-    event_sequence = 0
-    for e in json.loads(gamejson["tsgHome"]["events"]):
-        game.events.append(
-            parse_event(
-                e,
-                game_id,
-                home_team_id,
-                home_roster_lookup,
-                event_sequence=event_sequence,
-            )
+    game.events.extend(
+        parse_events(
+            gamejson["tsgHome"]["events"], game_id, home_team_id, home_roster_lookup
         )
-        event_sequence += 1
+    )
 
     away_roster_lookup = {}
     for player_id, vdict in away_roster_dict.items():
         away_roster_lookup[vdict["audl_id"]] = player_id
-    event_sequence = 0
-    for e in json.loads(gamejson["tsgAway"]["events"]):
-        game.events.append(
-            parse_event(
-                e,
-                game_id,
-                away_team_id,
-                away_roster_lookup,
-                event_sequence=event_sequence,
-            )
+    game.events.extend(
+        parse_events(
+            gamejson["tsgAway"]["events"], game_id, away_team_id, away_roster_lookup
         )
-        event_sequence += 1
+    )
+
+    heatmap_grids = accumulate_heatmaps(game.events, game.start_timestamp.year)
+    passes = accumulate_passes(game.events)
 
     print("Loading data to db")
     with Session(engine) as session:
@@ -193,3 +200,22 @@ def parse_load_game(engine: Engine, response: Response) -> None:
             stmt = insert(RosterORM).values(list(roster_dict.values()))
             session.execute(stmt)
             session.commit()
+
+        # Update heat maps
+        merge_heatmaps(session, heatmap_grids)
+        session.commit()
+
+        # Update pass networks
+        merge_passes(session, game_id, game.start_timestamp.year, passes)
+        session.commit()
+
+        # Load score timeline
+        session.add(
+            build_score_timeline(
+                game_id,
+                goal_times(gamejson["game"]["score_times_home"]),
+                goal_times(gamejson["game"]["score_times_away"]),
+                live=bool(gamejson["game"]["live"]),
+            )
+        )
+        session.commit()
@@ -0,0 +1,72 @@
+"""
+Builds thrower -> receiver pass networks from consecutive completions.
+"""
+from collections import Counter
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, Optional, Tuple
+from etl.event_types import POSSESSION_NEUTRAL_EVENTS
+from sql.models import EventORM, GamePassORM, SeasonPassORM
+
+# (team_id, thrower_id, receiver_id)
+PassKey = Tuple[str, str, str]
+
+
+def accumulate_passes(events: Iterable[EventORM]) -> Dict[PassKey, int]:
+    """
+    Counts thrower -> receiver completions in one game. The thrower of a
+    completion (or goal) is the receiver of the completion just before it in the
+    same possession. Events must be ordered by sequence within each team.
+    """
+    passes = Counter()
+    holder: Dict[str, Optional[str]] = {}
+
+    for e in events:
+        if e.event_type in ("Completion", "Score"):
+            thrower = holder.get(e.team_id)
+            if thrower and e.player_id:
+                passes[(e.team_id, thrower, e.player_id)] += 1
+            holder[e.team_id] = e.player_id if e.event_type == "Completion" else None
+        elif e.event_type not in POSSESSION_NEUTRAL_EVENTS:
+            holder[e.team_id] = None
+
+    return dict(passes)
+
+
+def merge_passes(
+    session: Session, game_id: str, season: int, passes: Dict[PassKey, int]
+) -> None:
+    """
+    Adds passes onto a game's pass network and the season totals, so it can be
+    called again with the passes of newly appended live events. Does not commit.
+    """
+    for (team_id, thrower_id, receiver_id), completions in passes.items():
+        game_pass: Optional[GamePassORM] = session.get(
+            GamePassORM, (game_id, team_id, thrower_id, receiver_id)
+        )
+        if game_pass:
+            game_pass.completions += completions
+        else:
+            session.add(
+                GamePassORM(
+                    game_id=game_id,
+                    team_id=team_id,
+                    thrower_id=thrower_id,
+                    receiver_id=receiver_id,
+                    completions=completions,
+                )
+            )
+        season_pass: Optional[SeasonPassORM] = session.get(
+            SeasonPassORM, (team_id, season, thrower_id, receiver_id)
+        )
+        if season_pass:
+            season_pass.completions += completions
+        else:
+            session.add(
+                SeasonPassORM(
+                    team_id=team_id,
+                    season=season,
+                    thrower_id=thrower_id,
+                    receiver_id=receiver_id,
+                    completions=completions,
+                )
+            )
@@ -0,0 +1,78 @@
+"""
+Local stand-in for the stats server that replays a finished game as if it were
+in progress, for exercising live ingestion. Run from the app directory with
+
+    python -m etl.replay_server tests/data/2021-06-12-DAL-AUS.json
+
+then follow it with
+
+    python -m etl.live http://localhost:8001/stats-pages/game/2021-06-12-DAL-AUS
+"""
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+
+def replay_payload(gamejson: dict, elapsed: float, events_per_second: float) -> dict:
+    """
+    Returns the game payload as it would have looked `elapsed` seconds into the
+    replay, revealing each team's events at `events_per_second`.
+    """
+    revealed = int(elapsed * events_per_second)
+    payload = json.loads(json.dumps(gamejson))
+    live = False
+    for tsg in ["tsgHome", "tsgAway"]:
+        events = json.loads(gamejson[tsg]["events"])
+        live = live or revealed < len(events)
+        payload[tsg]["events"] = json.dumps(events[:revealed])
+
+    # The home stream records home goals as Score and away goals as Opponent Score
+    home_events = json.loads(payload["tsgHome"]["events"])
+    for side, goal_type in [("home", 22), ("away", 21)]:
+        score = sum(e["t"] == goal_type for e in home_events)
+        payload["game"][f"score_{side}"] = score
+        # Keep the opening placeholder plus one entry per goal scored so far
+        score_times = gamejson["game"][f"score_times_{side}"]
+        payload["game"][f"score_times_{side}"] = score_times[: score + 1]
+    payload["game"]["live"] = live
+    return payload
+
+
+def make_handler(gamejson: dict, events_per_second: float):
+    started = time.monotonic()
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if not self.path.rstrip("/").endswith(gamejson["game"]["ext_game_id"]):
+                self.send_error(404)
+                return
+            payload = replay_payload(
+                gamejson, time.monotonic() - started, events_per_second
+            )
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return ReplayHandler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("fixture", help="Path to a saved game payload")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--events-per-second", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with open(args.fixture) as f:
+        gamejson = json.load(f)
+    server = HTTPServer(
+        ("localhost", args.port), make_handler(gamejson, args.events_per_second)
+    )
+    print(f"Replaying {gamejson['game']['ext_game_id']} on port {args.port}")
+    server.serve_forever()
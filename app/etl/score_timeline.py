@@ -0,0 +1,89 @@
+"""
+Compact per-game score timelines and the game-flow stats derived from them.
+"""
+import struct
+from typing import List
+from sql.models import ScoreTimelineORM
+
+REGULATION_SECONDS = 4 * 12 * 60
+
+
+def encode_times(times: List[int]) -> bytes:
+    return struct.pack(f"<{len(times)}i", *times)
+
+
+def decode_times(blob: bytes) -> List[int]:
+    return list(struct.unpack(f"<{len(blob) // 4}i", blob))
+
+
+def goal_times(score_times: List[int]) -> List[int]:
+    """
+    Returns the game-clock seconds of each goal. The source arrays start with a
+    placeholder entry for the opening score of 0.
+    """
+    return list(score_times or [])[1:]
+
+
+def build_score_timeline(
+    game_id: str, home_times: List[int], away_times: List[int], live: bool = False
+) -> ScoreTimelineORM:
+    """
+    Derives lead changes, largest leads, longest runs, time spent leading and the
+    deficit the winner came back from out of the goal times of each team.
+
+    For a live game the clock is only known up to the last goal, so time leading
+    stops there, and comeback stays 0 until there is a winner.
+    """
+    goals = sorted([(t, 1) for t in home_times] + [(t, -1) for t in away_times])
+    goal_clock = [t for t, _ in goals]
+    end = max(goal_clock or [0]) if live else max([REGULATION_SECONDS] + goal_clock)
+
+    diff = 0  # home minus away
+    leader = 0
+    lead_changes = 0
+    largest_lead = {1: 0, -1: 0}
+    longest_run = {1: 0, -1: 0}
+    seconds_leading = {1: 0, -1: 0}
+    run_side, run = 0, 0
+    last_time = 0
+    diffs = []
+
+    for t, side in goals:
+        if diff:
+            seconds_leading[1 if diff > 0 else -1] += t - last_time
+        last_time = t
+
+        diff += side
+        diffs.append(diff)
+        if diff and (1 if diff > 0 else -1) != leader:
+            if leader:
+                lead_changes += 1
+            leader = 1 if diff > 0 else -1
+        largest_lead[side] = max(largest_lead[side], diff * side)
+
+        run = run + 1 if side == run_side else 1
+        run_side = side
+        longest_run[side] = max(longest_run[side], run)
+
+    if diff:
+        seconds_leading[1 if diff > 0 else -1] += end - last_time
+
+    # Largest deficit the eventual winner faced at any point
+    comeback = 0
+    if diff and not live:
+        winner = 1 if diff > 0 else -1
+        comeback = max([0] + [-d * winner for d in diffs])
+
+    return ScoreTimelineORM(
+        game_id=game_id,
+        home_times=encode_times(home_times),
+        away_times=encode_times(away_times),
+        lead_changes=lead_changes,
+        largest_lead_home=largest_lead[1],
+        largest_lead_away=largest_lead[-1],
+        longest_run_home=longest_run[1],
+        longest_run_away=longest_run[-1],
+        seconds_home_leading=seconds_leading[1],
+        seconds_away_leading=seconds_leading[-1],
+        comeback=comeback,
+    )
@@ -1,5 +1,11 @@
-from fastapi import FastAPI, Request, Depends
-from fastapi.responses import HTMLResponse
+import asyncio
+import os
+import time
+
+_import_started = time.perf_counter()
+
+from fastapi import FastAPI, Request, Depends, HTTPException
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
@@ -7,26 +13,81 @@ from sqlalchemy.orm.session import sessionmaker
 from sqlalchemy.sql.expression import select
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import OperationalError
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, func
+from typing import List, Optional
 from schema.schema import Player
 from sql.models import PlayerORM
-from schema.schema import Game, Team, Roster
-from sql.utils import make_engine
-from sql.models import TeamORM, GameORM, RosterORM
+from schema.schema import Game, Team, Roster, HeatMap, PassConnection
+from schema.schema import ScoreTimeline, Comeback
+from sql.utils import make_serving_engine
+from sql.models import TeamORM, GameORM, RosterORM, HeatMapORM
+from sql.models import GamePassORM, SeasonPassORM, ScoreTimelineORM
+from views.score_flow import render_score_flow
 from views.season import summarize_season
+from views.search import SearchIndex
+from views.live import LiveBroadcaster
 
 app = FastAPI()
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+# Both are cheap (a directory check and a lazy template loader) and routes need
+# them at import, so they stay here but no longer depend on the working directory
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+app.mount(
+    "/static", StaticFiles(directory=os.path.join(APP_DIR, "static")), name="static"
+)
+templates = Jinja2Templates(directory=os.path.join(APP_DIR, "templates"))
+
+search_index = SearchIndex()
+broadcaster = LiveBroadcaster()
+
+
+@app.on_event("startup")
+def init_db():
+    # Built here rather than at import so workers (and tests) can import the app
+    # without db credentials and pay for the engine only once they serve. Each
+    # worker opens its own connections, including to a sqlite snapshot.
+    app.state.engine = make_serving_engine(echo=True)
+    app.state.SessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=app.state.engine
+    )
+
+
+@app.on_event("startup")
+def build_search_index():
+    try:
+        with app.state.SessionLocal() as db:
+            search_index.build(db)
+    except OperationalError as e:
+        # Search will build itself on first use once the db is reachable
+        print(f"Could not build search index: {e}")
+
+
+@app.on_event("startup")
+async def start_broadcaster():
+    app.state.broadcaster_task = asyncio.create_task(
+        broadcaster.run(app.state.SessionLocal)
+    )
+
+
+@app.on_event("startup")
+def report_boot_time():
+    app.state.boot_seconds = time.perf_counter() - _import_started
+    print(f"Worker ready in {app.state.boot_seconds * 1000:.0f} ms")
 
-engine = make_engine(echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+@app.on_event("shutdown")
+async def stop_broadcaster():
+    app.state.broadcaster_task.cancel()
 
-def get_db():
+
+@app.on_event("shutdown")
+def dispose_engine():
+    app.state.engine.dispose()
+
+
+def get_db(request: Request):
     try:
-        db = SessionLocal()
+        db = request.app.state.SessionLocal()
         yield db
     finally:
         db.close()
@@ -50,7 +111,7 @@ async def view_teams(request: Request, db: Session = Depends(get_db)):
 
 @app.get("/teams/{team_id}/view", response_class=HTMLResponse)
 async def view_teams(request: Request, team_id: str, db: Session = Depends(get_db)):
-    team_orm = db.query(TeamORM).filter(TeamORM.id == {team_id})
+    team_orm = db.query(TeamORM).filter(TeamORM.id == team_id)
     team = Team.from_orm(team_orm[0])
     try:
         games_orm = db.execute(
@@ -135,6 +196,19 @@ async def view_team_games(
             )
             home_roster = [Roster.from_orm(r[0]) for r in home_rosters_orm]
             away_roster = [Roster.from_orm(r[0]) for r in away_rosters_orm]
+
+            timeline_orm = db.get(ScoreTimelineORM, game_id)
+            timeline = ScoreTimeline.from_orm(timeline_orm) if timeline_orm else None
+            score_flow = (
+                render_score_flow(
+                    timeline.home_times,
+                    timeline.away_times,
+                    game.home_team.name,
+                    game.away_team.name,
+                )
+                if timeline
+                else None
+            )
             return templates.TemplateResponse(
                 "games/view.html",
                 {
@@ -142,6 +216,8 @@ async def view_team_games(
                     "game": game,
                     "home_roster": home_roster,
                     "away_roster": away_roster,
+                    "timeline": timeline,
+                    "score_flow": score_flow,
                 },
             )
         else:
@@ -163,3 +239,158 @@ async def view_player(request: Request, player_id: str, db: Session = Depends(ge
         )
     except OperationalError:
         return templates.TemplateResponse("error_page.html", {"request": request})
+
+
+@app.get("/search", response_class=HTMLResponse)
+def search(request: Request, q: str = "", db: Session = Depends(get_db)):
+    try:
+        search_index.refresh_if_stale(db)
+    except OperationalError as e:
+        print(f"Could not refresh search index: {e}")
+    return templates.TemplateResponse(
+        "search/results.html",
+        {"request": request, "results": search_index.search(q)},
+    )
+
+
+@app.get("/heatmaps/{scope}/{scope_id}")
+def view_heatmap(
+    scope: str,
+    scope_id: str,
+    kind: str = "completion",
+    season: Optional[int] = None,
+    format: str = "svg",
+    db: Session = Depends(get_db),
+):
+    if format not in ("svg", "json"):
+        raise HTTPException(status_code=400, detail="format must be svg or json")
+    query = db.query(HeatMapORM).filter(
+        HeatMapORM.scope == scope,
+        HeatMapORM.scope_id == scope_id,
+        HeatMapORM.event_kind == kind,
+    )
+    if season is not None:
+        query = query.filter(HeatMapORM.season == season)
+    heat_maps = query.all()
+    if not heat_maps:
+        raise HTTPException(status_code=404, detail="Heat map not found")
+
+    # numpy is slow to import, so only pay for it when a heat map is requested
+    from etl.heatmaps import decode_counts
+    from views.heatmap import render_svg
+
+    counts = sum(decode_counts(h) for h in heat_maps)
+    if format == "json":
+        return HeatMap(
+            scope=scope,
+            scope_id=scope_id,
+            season=season,
+            event_kind=kind,
+            total=int(counts.sum()),
+            counts=counts.tolist(),
+        )
+    return Response(render_svg(counts, f"{kind} heat map"), media_type="image/svg+xml")
+
+
+def _latest_pass_season(db: Session, *criteria) -> Optional[int]:
+    return db.query(func.max(SeasonPassORM.season)).filter(*criteria).scalar()
+
+
+@app.get("/teams/{team_id}/passes", response_model=List[PassConnection])
+def view_team_passes(
+    team_id: str,
+    season: Optional[int] = None,
+    limit: int = 10,
+    db: Session = Depends(get_db),
+):
+    if season is None:
+        season = _latest_pass_season(db, SeasonPassORM.team_id == team_id)
+    return (
+        db.query(SeasonPassORM)
+        .options(joinedload(SeasonPassORM.thrower), joinedload(SeasonPassORM.receiver))
+        .filter(SeasonPassORM.team_id == team_id, SeasonPassORM.season == season)
+        .order_by(SeasonPassORM.completions.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+@app.get("/players/{player_id}/targets", response_model=List[PassConnection])
+def view_player_targets(
+    player_id: str,
+    season: Optional[int] = None,
+    limit: int = 5,
+    db: Session = Depends(get_db),
+):
+    if season is None:
+        season = _latest_pass_season(db, SeasonPassORM.thrower_id == player_id)
+    return (
+        db.query(SeasonPassORM)
+        .options(joinedload(SeasonPassORM.thrower), joinedload(SeasonPassORM.receiver))
+        .filter(SeasonPassORM.thrower_id == player_id, SeasonPassORM.season == season)
+        .order_by(SeasonPassORM.completions.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+@app.get("/games/{game_id}/passes", response_model=List[PassConnection])
+def view_game_passes(
+    game_id: str, team_id: Optional[str] = None, db: Session = Depends(get_db)
+):
+    query = (
+        db.query(GamePassORM)
+        .options(joinedload(GamePassORM.thrower), joinedload(GamePassORM.receiver))
+        .filter(GamePassORM.game_id == game_id)
+    )
+    if team_id:
+        query = query.filter(GamePassORM.team_id == team_id)
+    return query.order_by(GamePassORM.completions.desc()).all()
+
+
+@app.get("/games/{game_id}/live")
+async def stream_game(request: Request, game_id: str):
+    queue = broadcaster.subscribe(game_id)
+
+    async def stream():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                yield message.to_sse()
+        finally:
+            broadcaster.unsubscribe(game_id, queue)
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+@app.get("/games/{game_id}/score_timeline", response_model=ScoreTimeline)
+def view_score_timeline(game_id: str, db: Session = Depends(get_db)):
+    timeline = db.get(ScoreTimelineORM, game_id)
+    if not timeline:
+        raise HTTPException(status_code=404, detail="Score timeline not found")
+    return timeline
+
+
+@app.get("/games/comebacks", response_model=List[Comeback])
+def view_comebacks(limit: int = 10, db: Session = Depends(get_db)):
+    return (
+        db.query(ScoreTimelineORM)
+        .options(
+            joinedload(ScoreTimelineORM.game).joinedload(GameORM.home_team),
+            joinedload(ScoreTimelineORM.game).joinedload(GameORM.away_team),
+        )
+        .join(ScoreTimelineORM.game)
+        .filter(
+            ScoreTimelineORM.comeback > 0,
+            # Only finished games have a winner
+            or_(GameORM.live == False, GameORM.live.is_(None)),
+        )
+        .order_by(ScoreTimelineORM.comeback.desc())
+        .limit(limit)
+        .all()
+    )
@@ -1,7 +1,8 @@
 from datetime import date, datetime
-from pydantic import BaseModel, Json
+from pydantic import BaseModel, Json, validator
 from typing import List, Optional
 from sql.models import Base
+from etl.score_timeline import decode_times
 
 
 class Event(BaseModel):
@@ -64,6 +65,7 @@ class Game(BaseModel):
     away_score: int
     start_timestamp: datetime
     start_timezone: str
+    live: Optional[bool]
     upload_timestamp: datetime
 
     # events: List[Event]
@@ -72,3 +74,52 @@ class Game(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class HeatMap(BaseModel):
+    scope: str
+    scope_id: str
+    season: Optional[int]
+    event_kind: str
+    total: int
+    counts: List[List[int]]
+
+
+class PassConnection(BaseModel):
+    team_id: str
+    thrower: Player
+    receiver: Player
+    completions: int
+
+    class Config:
+        orm_mode = True
+
+
+class ScoreTimeline(BaseModel):
+    game_id: str
+    home_times: List[int]
+    away_times: List[int]
+    lead_changes: int
+    largest_lead_home: int
+    largest_lead_away: int
+    longest_run_home: int
+    longest_run_away: int
+    seconds_home_leading: int
+    seconds_away_leading: int
+    comeback: int
+
+    @validator("home_times", "away_times", pre=True)
+    def decode_blob(cls, v):
+        return decode_times(v) if isinstance(v, bytes) else v
+
+    class Config:
+        orm_mode = True
+
+
+class Comeback(BaseModel):
+    game: Game
+    comeback: int
+    lead_changes: int
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,28 @@
+"""
+One-off script to add the live game column and event sequence index to a
+database whose game and event tables predate them. create_tables.py only
+creates missing tables, so it cannot make these changes.
+"""
+
+from sqlalchemy import inspect, text
+from sql.utils import make_engine
+
+
+if __name__ == "__main__":
+    engine = make_engine()
+    inspector = inspect(engine)
+
+    with engine.begin() as conn:
+        if "live" not in [c["name"] for c in inspector.get_columns("game")]:
+            print("Adding game.live")
+            conn.execute(text("ALTER TABLE game ADD COLUMN live BOOL DEFAULT 0"))
+        if "ix_event_game_team_sequence" not in [
+            i["name"] for i in inspector.get_indexes("event")
+        ]:
+            print("Adding ix_event_game_team_sequence")
+            conn.execute(
+                text(
+                    "CREATE INDEX ix_event_game_team_sequence "
+                    "ON event (game_id, team_id, sequence)"
+                )
+            )
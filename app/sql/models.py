@@ -6,11 +6,11 @@ from typing import Optional
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql.schema import ForeignKeyConstraint
+from sqlalchemy.sql.schema import ForeignKeyConstraint, Index
 from typing import List
 
 
-from sqlalchemy.sql.sqltypes import JSON, Boolean, DateTime, Float
+from sqlalchemy.sql.sqltypes import JSON, Boolean, DateTime, Float, LargeBinary
 
 Base = declarative_base()
 
@@ -98,6 +98,7 @@ class GameORM(Base):
     away_score = Column(Integer)
     start_timestamp = Column(DateTime)
     start_timezone = Column(String(3))
+    live = Column(Boolean, default=False)
     upload_timestamp = Column(DateTime, default=datetime.now())
 
     events = relationship("EventORM", back_populates="game")
@@ -116,6 +117,7 @@ class GameORM(Base):
         start_timezone: str,
         id: Optional[str] = None,
         events: Optional[list] = [],
+        live: Optional[bool] = False,
     ):
         self.id = id
         self.audl_id = audl_id
@@ -127,6 +129,7 @@ class GameORM(Base):
         self.start_timestamp = start_timestamp
         self.start_timezone = start_timezone
         self.events = events
+        self.live = live
 
 
 class PlayerORM(Base):
@@ -148,6 +151,7 @@ class EventORM(Base):
         ForeignKeyConstraint(["player_id"], ["player.id"]),
         ForeignKeyConstraint(["team_id"], ["team.id"]),
         ForeignKeyConstraint(["game_id"], ["game.id"]),
+        Index("ix_event_game_team_sequence", "game_id", "team_id", "sequence"),
     )
 
     id = Column(String(16), primary_key=True, default=uuid16())
@@ -183,3 +187,151 @@ class EventORM(Base):
         self.event_type = event_type
         self.event_data_json = json.dumps(event_data_json)
         self.sequence = sequence
+
+
+class HeatMapORM(Base):
+    __tablename__ = "heat_map"
+
+    scope = Column(String(8), primary_key=True)  # "player" or "team"
+    scope_id = Column(String(16), primary_key=True)
+    season = Column(Integer, primary_key=True)
+    event_kind = Column(String(16), primary_key=True)
+    n_rows = Column(Integer, nullable=False)
+    n_cols = Column(Integer, nullable=False)
+    total = Column(Integer, nullable=False)
+    counts = Column(LargeBinary, nullable=False)
+
+    def __init__(
+        self,
+        scope: str,
+        scope_id: str,
+        season: int,
+        event_kind: str,
+        n_rows: int,
+        n_cols: int,
+        total: int,
+        counts: bytes,
+    ):
+        self.scope = scope
+        self.scope_id = scope_id
+        self.season = season
+        self.event_kind = event_kind
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.total = total
+        self.counts = counts
+
+
+class GamePassORM(Base):
+    __tablename__ = "game_pass"
+    __table_args__ = (
+        ForeignKeyConstraint(["game_id"], ["game.id"]),
+        ForeignKeyConstraint(["team_id"], ["team.id"]),
+        ForeignKeyConstraint(["thrower_id"], ["player.id"]),
+        ForeignKeyConstraint(["receiver_id"], ["player.id"]),
+    )
+
+    game_id = Column(String(16), primary_key=True)
+    team_id = Column(String(16), primary_key=True)
+    thrower_id = Column(String(16), primary_key=True)
+    receiver_id = Column(String(16), primary_key=True)
+    completions = Column(Integer, nullable=False)
+
+    thrower = relationship("PlayerORM", foreign_keys=[thrower_id])
+    receiver = relationship("PlayerORM", foreign_keys=[receiver_id])
+
+    def __init__(
+        self,
+        game_id: str,
+        team_id: str,
+        thrower_id: str,
+        receiver_id: str,
+        completions: int,
+    ):
+        self.game_id = game_id
+        self.team_id = team_id
+        self.thrower_id = thrower_id
+        self.receiver_id = receiver_id
+        self.completions = completions
+
+
+class SeasonPassORM(Base):
+    __tablename__ = "season_pass"
+    __table_args__ = (
+        ForeignKeyConstraint(["team_id"], ["team.id"]),
+        ForeignKeyConstraint(["thrower_id"], ["player.id"]),
+        ForeignKeyConstraint(["receiver_id"], ["player.id"]),
+        Index("ix_season_pass_team_top", "team_id", "season", "completions"),
+        Index("ix_season_pass_thrower_top", "thrower_id", "season", "completions"),
+    )
+
+    team_id = Column(String(16), primary_key=True)
+    season = Column(Integer, primary_key=True)
+    thrower_id = Column(String(16), primary_key=True)
+    receiver_id = Column(String(16), primary_key=True)
+    completions = Column(Integer, nullable=False)
+
+    thrower = relationship("PlayerORM", foreign_keys=[thrower_id])
+    receiver = relationship("PlayerORM", foreign_keys=[receiver_id])
+
+    def __init__(
+        self,
+        team_id: str,
+        season: int,
+        thrower_id: str,
+        receiver_id: str,
+        completions: int,
+    ):
+        self.team_id = team_id
+        self.season = season
+        self.thrower_id = thrower_id
+        self.receiver_id = receiver_id
+        self.completions = completions
+
+
+class ScoreTimelineORM(Base):
+    __tablename__ = "score_timeline"
+    __table_args__ = (
+        ForeignKeyConstraint(["game_id"], ["game.id"]),
+        Index("ix_score_timeline_comeback", "comeback"),
+    )
+
+    game_id = Column(String(16), primary_key=True)
+    home_times = Column(LargeBinary, nullable=False)
+    away_times = Column(LargeBinary, nullable=False)
+    lead_changes = Column(Integer, nullable=False)
+    largest_lead_home = Column(Integer, nullable=False)
+    largest_lead_away = Column(Integer, nullable=False)
+    longest_run_home = Column(Integer, nullable=False)
+    longest_run_away = Column(Integer, nullable=False)
+    seconds_home_leading = Column(Integer, nullable=False)
+    seconds_away_leading = Column(Integer, nullable=False)
+    comeback = Column(Integer, nullable=False)
+
+    game = relationship("GameORM")
+
+    def __init__(
+        self,
+        game_id: str,
+        home_times: bytes,
+        away_times: bytes,
+        lead_changes: int,
+        largest_lead_home: int,
+        largest_lead_away: int,
+        longest_run_home: int,
+        longest_run_away: int,
+        seconds_home_leading: int,
+        seconds_away_leading: int,
+        comeback: int,
+    ):
+        self.game_id = game_id
+        self.home_times = home_times
+        self.away_times = away_times
+        self.lead_changes = lead_changes
+        self.largest_lead_home = largest_lead_home
+        self.largest_lead_away = largest_lead_away
+        self.longest_run_home = longest_run_home
+        self.longest_run_away = longest_run_away
+        self.seconds_home_leading = seconds_home_leading
+        self.seconds_away_leading = seconds_away_leading
+        self.comeback = comeback
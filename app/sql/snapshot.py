@@ -0,0 +1,61 @@
+"""
+Exports the current database, derived tables included, into an indexed,
+read-only sqlite file that the web app can serve from instead of mysql. Run
+from the app directory with
+
+    python -m sql.snapshot [PATH]
+"""
+import argparse
+import os
+import stat
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine.base import Engine
+from sql.models import Base
+from sql.utils import make_engine
+
+BATCH_SIZE = 5000
+
+
+def export_snapshot(source: Engine, path: str) -> None:
+    """
+    Copies every table into a new sqlite file at path. The file is built next
+    to path and renamed into place, so a running app never sees a partial copy.
+    """
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    target = create_engine(f"sqlite:///{tmp_path}")
+    Base.metadata.create_all(target)
+
+    with source.connect() as src, target.begin() as dst:
+        src = src.execution_options(stream_results=True)
+        for table in Base.metadata.sorted_tables:
+            result = src.execute(select(table)).mappings()
+            copied = 0
+            while True:
+                rows = result.fetchmany(BATCH_SIZE)
+                if not rows:
+                    break
+                dst.execute(table.insert(), [dict(r) for r in rows])
+                copied += len(rows)
+            print(f"Copied {copied} rows from {table.name}")
+
+    with target.connect() as conn:
+        # Planner statistics for the indexes, then compact the file
+        conn.exec_driver_sql("ANALYZE")
+        conn.exec_driver_sql("VACUUM")
+    target.dispose()
+
+    os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    os.replace(tmp_path, path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("path", nargs="?", default="snapshot.sqlite")
+    args = parser.parse_args()
+
+    export_snapshot(make_engine(echo=False), args.path)
+    print(f"Wrote snapshot to {args.path}")
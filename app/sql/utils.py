@@ -1,5 +1,6 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
 from urllib.parse import quote_plus
 from typing import Optional
@@ -16,3 +17,29 @@ def make_engine(echo: Optional[bool] = False) -> Engine:
     pw = quote_plus(os.getenv("MYSQL_ADMIN_PW"))
     db = os.getenv("MYSQL_DATABASE")
     return create_engine(f"mysql+pymysql://{user}:{pw}@{host}/{db}", echo=echo)
+
+
+def make_snapshot_engine(path: str, echo: Optional[bool] = False) -> Engine:
+    """
+    Creates a read-only engine over a sqlite snapshot made by sql.snapshot.
+    Connections are opened once and reused by whichever thread checks them out.
+    """
+    return create_engine(
+        f"sqlite:///file:{os.path.abspath(path)}?mode=ro&uri=true",
+        echo=echo,
+        poolclass=QueuePool,
+        connect_args={"check_same_thread": False},
+    )
+
+
+def make_serving_engine(echo: Optional[bool] = False) -> Engine:
+    """
+    Serves from the sqlite snapshot at SQLITE_SNAPSHOT when that file exists,
+    otherwise from mysql.
+    """
+    load_dotenv()
+    snapshot = os.getenv("SQLITE_SNAPSHOT")
+    if snapshot and os.path.exists(snapshot):
+        print(f"Serving from sqlite snapshot {snapshot}")
+        return make_snapshot_engine(snapshot, echo=echo)
+    return make_engine(echo=echo)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules import each other relative to the app directory, as the app does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
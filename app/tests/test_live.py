@@ -0,0 +1,181 @@
+import json
+import os
+import pytest
+import requests
+import threading
+from http.server import HTTPServer
+from requests.models import Response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from etl.live import append_live_events, poll_live_game
+from etl.parser import parse_load_game
+from etl.replay_server import make_handler, replay_payload
+from sql.models import (
+    Base,
+    EventORM,
+    GameORM,
+    GamePassORM,
+    HeatMapORM,
+    PlayerORM,
+    ScoreTimelineORM,
+    SeasonPassORM,
+    TeamORM,
+)
+from views.live import LiveBroadcaster
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "data", "2021-06-12-DAL-AUS.json")
+
+
+def make_response(gamejson: dict) -> Response:
+    response = Response()
+    response._content = json.dumps(gamejson).encode()
+    return response
+
+
+def make_sqlite_engine(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def snapshot(engine) -> dict:
+    """
+    Returns the loaded data keyed by audl ids, since db ids are random per load.
+    """
+    with Session(engine) as session:
+        teams = {t.id: t.audl_id for t in session.query(TeamORM)}
+        players = {p.id: p.audl_id for p in session.query(PlayerORM)}
+        scope_ids = {**teams, **players}
+        game = session.query(GameORM).one()
+        timeline = session.query(ScoreTimelineORM).one()
+        return {
+            "score": (game.home_score, game.away_score, game.live),
+            "events": sorted(
+                (
+                    teams[e.team_id],
+                    e.sequence,
+                    e.event_type,
+                    players.get(e.player_id),
+                    e.coordinate_x,
+                    e.coordinate_y,
+                )
+                for e in session.query(EventORM)
+            ),
+            "heat_map": sorted(
+                (h.scope, scope_ids[h.scope_id], h.season, h.event_kind, h.counts)
+                for h in session.query(HeatMapORM)
+            ),
+            "game_pass": sorted(
+                (
+                    teams[p.team_id],
+                    players[p.thrower_id],
+                    players[p.receiver_id],
+                    p.completions,
+                )
+                for p in session.query(GamePassORM)
+            ),
+            "season_pass": sorted(
+                (
+                    teams[p.team_id],
+                    p.season,
+                    players[p.thrower_id],
+                    players[p.receiver_id],
+                    p.completions,
+                )
+                for p in session.query(SeasonPassORM)
+            ),
+            "score_timeline": {
+                column.name: getattr(timeline, column.name)
+                for column in ScoreTimelineORM.__table__.columns
+                if column.name != "game_id"
+            },
+        }
+
+
+@pytest.fixture
+def gamejson():
+    with open(FIXTURE) as f:
+        return json.load(f)
+
+
+def test_live_replay_matches_batch_load(gamejson, tmp_path):
+    batch = make_sqlite_engine(tmp_path / "batch.sqlite")
+    parse_load_game(batch, make_response(gamejson))
+
+    live = make_sqlite_engine(tmp_path / "live.sqlite")
+    # Uneven steps so polls land in the middle of possessions
+    elapsed, added, polls = 0.0, 0, 0
+    while True:
+        payload = replay_payload(gamejson, elapsed, events_per_second=1.0)
+        added += append_live_events(live, make_response(payload))
+        polls += 1
+        if not payload["game"]["live"]:
+            break
+        elapsed += 7 + polls % 13
+
+    assert polls > 2
+    expected = snapshot(batch)
+    actual = snapshot(live)
+    assert added == len(expected["events"])
+    for table in expected:
+        assert actual[table] == expected[table], table
+
+
+def test_append_is_idempotent(gamejson, tmp_path):
+    engine = make_sqlite_engine(tmp_path / "live.sqlite")
+    payload = replay_payload(gamejson, 100.0, events_per_second=1.0)
+
+    append_live_events(engine, make_response(payload))
+    first = snapshot(engine)
+    assert append_live_events(engine, make_response(payload)) == 0
+    assert snapshot(engine) == first
+
+
+def test_broadcaster_sends_final_events_before_final_score(gamejson, tmp_path):
+    engine = make_sqlite_engine(tmp_path / "live.sqlite")
+    append_live_events(
+        engine, make_response(replay_payload(gamejson, 400.0, events_per_second=1.0))
+    )
+    with Session(engine) as session:
+        game_id = session.query(GameORM).one().id
+
+    broadcaster = LiveBroadcaster()
+    broadcaster.subscribe(game_id)
+    with Session(engine) as session:
+        broadcaster.poll(session)  # Baseline
+
+    append_live_events(
+        engine, make_response(replay_payload(gamejson, 1e6, events_per_second=1.0))
+    )
+    with Session(engine) as session:
+        messages = [m for _, m in broadcaster.poll(session)]
+
+    assert [m.event for m in messages] == ["events", "events", "score"]
+    assert messages[-1].data == {"home_score": 24, "away_score": 23, "live": False}
+
+
+def test_poll_live_game_against_replay_server(gamejson, tmp_path, capsys):
+    batch = make_sqlite_engine(tmp_path / "batch.sqlite")
+    parse_load_game(batch, make_response(gamejson))
+
+    server = HTTPServer(("localhost", 0), make_handler(gamejson, 400.0))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://localhost:{server.server_port}/stats-pages/game/"
+    try:
+        assert requests.get(base_url + "some-other-game").status_code == 404
+
+        live = make_sqlite_engine(tmp_path / "live.sqlite")
+        poll_live_game(live, base_url + gamejson["game"]["ext_game_id"], 0.1)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    output = capsys.readouterr().out
+    assert output.count("Added") > 2
+    assert output.rstrip().endswith("Game is no longer live.")
+    expected = snapshot(batch)
+    actual = snapshot(live)
+    assert len(actual["events"]) == 843
+    assert actual["score"] == (24, 23, False)
+    for table in expected:
+        assert actual[table] == expected[table], table
@@ -0,0 +1,38 @@
+import json
+import os
+from fastapi.testclient import TestClient
+from requests.models import Response
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from etl.parser import parse_load_game
+from sql.models import Base, GameORM
+from sql.snapshot import export_snapshot
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "data", "2021-06-12-DAL-AUS.json")
+
+
+def test_app_serves_from_snapshot_without_mysql(tmp_path, monkeypatch):
+    source = create_engine(f"sqlite:///{tmp_path / 'source.sqlite'}")
+    Base.metadata.create_all(source)
+    response = Response()
+    with open(FIXTURE, "rb") as f:
+        response._content = f.read()
+    parse_load_game(source, response)
+    with Session(source) as session:
+        game_id = session.query(GameORM).one().id
+
+    snapshot = tmp_path / "snapshot.sqlite"
+    export_snapshot(source, str(snapshot))
+    monkeypatch.setenv("SQLITE_SNAPSHOT", str(snapshot))
+
+    # Importing must not need db credentials or app/ as the working directory
+    import main
+
+    with TestClient(main.app) as client:
+        assert client.get("/").status_code == 200
+        assert client.get("/static/js/htmx.js").status_code == 200
+        page = client.get(f"/games/{game_id}/view")
+        assert page.status_code == 200
+        assert "Score flow" in page.text
+        comebacks = client.get("/games/comebacks").json()
+        assert [c["game"]["id"] for c in comebacks] == [game_id]
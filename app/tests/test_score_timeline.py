@@ -0,0 +1,103 @@
+import json
+import os
+from etl.score_timeline import (
+    REGULATION_SECONDS,
+    build_score_timeline,
+    decode_times,
+    goal_times,
+)
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "data", "2021-06-12-DAL-AUS.json")
+
+STATS = [
+    "lead_changes",
+    "largest_lead_home",
+    "largest_lead_away",
+    "longest_run_home",
+    "longest_run_away",
+    "seconds_home_leading",
+    "seconds_away_leading",
+    "comeback",
+]
+
+
+def stats(timeline) -> dict:
+    return {name: getattr(timeline, name) for name in STATS}
+
+
+def test_tie_then_flip():
+    # 1-0, 1-1, 1-2: away takes the lead after a tie and wins
+    timeline = build_score_timeline("g", [100], [200, 300])
+    assert stats(timeline) == {
+        "lead_changes": 1,
+        "largest_lead_home": 1,
+        "largest_lead_away": 1,
+        "longest_run_home": 1,
+        "longest_run_away": 2,
+        "seconds_home_leading": 100,
+        "seconds_away_leading": REGULATION_SECONDS - 300,
+        "comeback": 1,
+    }
+
+
+def test_run():
+    timeline = build_score_timeline("g", [10, 20, 30, 40], [50])
+    assert stats(timeline) == {
+        "lead_changes": 0,
+        "largest_lead_home": 4,
+        "largest_lead_away": 0,
+        "longest_run_home": 4,
+        "longest_run_away": 1,
+        "seconds_home_leading": REGULATION_SECONDS - 10,
+        "seconds_away_leading": 0,
+        "comeback": 0,
+    }
+
+
+def test_winner_comes_back_from_behind():
+    # Away leads 0-3, home scores the next four to win 4-3
+    timeline = build_score_timeline("g", [40, 50, 60, 70], [10, 20, 30])
+    assert stats(timeline) == {
+        "lead_changes": 1,
+        "largest_lead_home": 1,
+        "largest_lead_away": 3,
+        "longest_run_home": 4,
+        "longest_run_away": 3,
+        "seconds_home_leading": REGULATION_SECONDS - 70,
+        "seconds_away_leading": 50,
+        "comeback": 3,
+    }
+
+
+def test_live_game_stops_at_last_goal():
+    timeline = build_score_timeline("g", [141], [], live=True)
+    assert timeline.seconds_home_leading == 0
+    assert timeline.comeback == 0
+
+    timeline = build_score_timeline("g", [100], [200, 300], live=True)
+    assert timeline.seconds_home_leading == 100
+    assert timeline.seconds_away_leading == 0
+    assert timeline.comeback == 0
+
+
+def test_fixture_game():
+    with open(FIXTURE) as f:
+        game = json.load(f)["game"]
+    home_times = goal_times(game["score_times_home"])
+    away_times = goal_times(game["score_times_away"])
+    timeline = build_score_timeline("g", home_times, away_times)
+
+    assert len(home_times) == game["score_home"]
+    assert len(away_times) == game["score_away"]
+    assert decode_times(timeline.home_times) == home_times
+    assert decode_times(timeline.away_times) == away_times
+    assert stats(timeline) == {
+        "lead_changes": 3,
+        "largest_lead_home": 3,
+        "largest_lead_away": 1,
+        "longest_run_home": 3,
+        "longest_run_away": 3,
+        "seconds_home_leading": 1781,
+        "seconds_away_leading": 119,
+        "comeback": 1,
+    }
@@ -0,0 +1,41 @@
+import numpy as np
+from html import escape
+from etl.heatmaps import FIELD_X_MAX, FIELD_X_MIN, FIELD_Y_MAX, FIELD_Y_MIN
+
+SVG_SCALE = 4  # pixels per yard
+
+
+def render_svg(counts: np.ndarray, title: str) -> str:
+    """
+    Renders a heat map grid as an SVG of the field, endzones at top and bottom.
+    """
+    n_rows, n_cols = counts.shape
+    width = (FIELD_X_MAX - FIELD_X_MIN) * SVG_SCALE
+    height = (FIELD_Y_MAX - FIELD_Y_MIN) * SVG_SCALE
+    cell_w = width / n_cols
+    cell_h = height / n_rows
+    peak = counts.max() or 1
+
+    cells = []
+    for row in range(n_rows):
+        for col in range(n_cols):
+            if counts[row, col]:
+                cells.append(
+                    f'<rect x="{col * cell_w:.1f}" y="{height - (row + 1) * cell_h:.1f}" '
+                    f'width="{cell_w:.1f}" height="{cell_h:.1f}" fill="#d7301f" '
+                    f'fill-opacity="{counts[row, col] / peak:.2f}">'
+                    f"<title>{counts[row, col]}</title></rect>"
+                )
+
+    endzone = 20 * SVG_SCALE
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width:.0f} {height:.0f}" '
+        f'width="{width:.0f}" height="{height:.0f}">'
+        f"<title>{escape(title)}</title>"
+        f'<rect width="{width:.0f}" height="{height:.0f}" fill="#e5f5e0"/>'
+        + "".join(cells)
+        + f'<line x1="0" y1="{endzone}" x2="{width:.0f}" y2="{endzone}" stroke="white"/>'
+        f'<line x1="0" y1="{height - endzone:.0f}" x2="{width:.0f}" '
+        f'y2="{height - endzone:.0f}" stroke="white"/>'
+        "</svg>"
+    )
@@ -0,0 +1,137 @@
+"""
+Pushes score and event updates of live games to connected pages.
+"""
+import asyncio
+import json
+from pydantic import BaseModel
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from sql.models import EventORM, GameORM, PlayerORM
+
+
+class LiveMessage(BaseModel):
+    event: str  # "score" or "events"
+    data: dict
+
+    def to_sse(self) -> str:
+        return f"event: {self.event}\ndata: {json.dumps(self.data)}\n\n"
+
+
+class LiveBroadcaster:
+    """
+    One poller per worker that fans updates out to every subscribed page, so the
+    db sees a single small query per interval however many pages are open.
+    """
+
+    def __init__(self, interval: Optional[float] = 2.0, queue_size: int = 100):
+        self.interval = interval
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._scores: Dict[str, dict] = {}
+        self._last_sequence: Dict[Tuple[str, str], int] = {}
+
+    def subscribe(self, game_id: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(game_id, set()).add(queue)
+        if game_id in self._scores:
+            queue.put_nowait(LiveMessage(event="score", data=self._scores[game_id]))
+        return queue
+
+    def unsubscribe(self, game_id: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(game_id, set())
+        queues.discard(queue)
+        if not queues:
+            self._subscribers.pop(game_id, None)
+
+    def publish(self, game_id: str, message: LiveMessage) -> None:
+        for queue in self._subscribers.get(game_id, set()):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A stalled client should not hold up the others
+                pass
+
+    def poll(self, db: Session) -> List[Tuple[str, LiveMessage]]:
+        """
+        Returns messages for the watched games whose score or event streams
+        changed since the last poll.
+        """
+        game_ids = list(self._subscribers)
+        # Forget games nobody is watching so a returning page starts fresh
+        self._scores = {k: v for k, v in self._scores.items() if k in game_ids}
+        self._last_sequence = {
+            k: v for k, v in self._last_sequence.items() if k[0] in game_ids
+        }
+        if not game_ids:
+            return []
+        messages = []
+        # Scores go last so a page that stops listening once a game is final
+        # has already received the game's closing events
+        score_messages = []
+
+        for game in db.query(GameORM).filter(GameORM.id.in_(game_ids)):
+            score = {
+                "home_score": game.home_score,
+                "away_score": game.away_score,
+                "live": bool(game.live),
+            }
+            if self._scores.get(game.id) != score:
+                self._scores[game.id] = score
+                score_messages.append((game.id, LiveMessage(event="score", data=score)))
+
+        latest = (
+            db.query(EventORM.game_id, EventORM.team_id, func.max(EventORM.sequence))
+            .filter(EventORM.game_id.in_(game_ids))
+            .group_by(EventORM.game_id, EventORM.team_id)
+        )
+        for game_id, team_id, sequence in latest:
+            key = (game_id, team_id)
+            last = self._last_sequence.get(key)
+            self._last_sequence[key] = sequence
+            # The first poll of a stream only sets the baseline
+            if last is None or sequence <= last:
+                continue
+            new_events = (
+                db.query(EventORM, PlayerORM)
+                .outerjoin(PlayerORM, EventORM.player_id == PlayerORM.id)
+                .filter(
+                    EventORM.game_id == game_id,
+                    EventORM.team_id == team_id,
+                    EventORM.sequence > last,
+                )
+                .order_by(EventORM.sequence)
+            )
+            data = {
+                "team_id": team_id,
+                "events": [
+                    {
+                        "sequence": e.sequence,
+                        "event_type": e.event_type,
+                        "player": f"{p.first_name} {p.last_name}" if p else None,
+                    }
+                    for e, p in new_events
+                ],
+            }
+            messages.append((game_id, LiveMessage(event="events", data=data)))
+
+        return messages + score_messages
+
+    async def run(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Polls and publishes until cancelled.
+        """
+
+        def poll_once() -> List[Tuple[str, LiveMessage]]:
+            with session_factory() as db:
+                return self.poll(db)
+
+        while True:
+            try:
+                messages = await run_in_threadpool(poll_once)
+                for game_id, message in messages:
+                    self.publish(game_id, message)
+            except Exception as e:
+                print(f"Live update failed: {e}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,56 @@
+from html import escape
+from typing import List
+from etl.score_timeline import REGULATION_SECONDS
+
+WIDTH = 600
+HEIGHT = 200
+PADDING = 20
+
+
+def _step_path(times: List[int], end: int, max_score: int) -> str:
+    """
+    Returns an SVG path stepping up by one goal at each time.
+    """
+
+    def x(t: float) -> float:
+        return PADDING + t / end * (WIDTH - 2 * PADDING)
+
+    def y(score: int) -> float:
+        return HEIGHT - PADDING - score / max_score * (HEIGHT - 2 * PADDING)
+
+    points = [f"M{x(0):.1f},{y(0):.1f}"]
+    for score, t in enumerate(times, start=1):
+        points.append(f"H{x(t):.1f}V{y(score):.1f}")
+    points.append(f"H{x(end):.1f}")
+    return "".join(points)
+
+
+def render_score_flow(
+    home_times: List[int], away_times: List[int], home_name: str, away_name: str
+) -> str:
+    """
+    Renders both teams' running scores against the game clock as an SVG.
+    """
+    end = max([REGULATION_SECONDS] + home_times + away_times)
+    max_score = max(len(home_times), len(away_times), 1)
+    lines = []
+    for times, name, colour in [
+        (home_times, home_name, "#3273dc"),
+        (away_times, away_name, "#f14668"),
+    ]:
+        lines.append(
+            f'<path d="{_step_path(times, end, max_score)}" fill="none" '
+            f'stroke="{colour}" stroke-width="2"><title>{escape(name)}</title></path>'
+        )
+    quarters = "".join(
+        f'<line x1="{x:.1f}" y1="{PADDING}" x2="{x:.1f}" y2="{HEIGHT - PADDING}" '
+        'stroke="#dbdbdb"/>'
+        for x in (
+            PADDING + q * REGULATION_SECONDS / 4 / end * (WIDTH - 2 * PADDING)
+            for q in range(1, 4)
+        )
+    )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" '
+        f'width="100%">' + quarters + "".join(lines) + "</svg>"
+    )
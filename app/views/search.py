@@ -0,0 +1,122 @@
+"""
+In-memory prefix index over player and team names for the navbar search box.
+"""
+import time
+from collections import defaultdict
+from pydantic import BaseModel
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Set
+from sql.models import GameORM, PlayerORM, TeamORM
+
+
+class SearchResult(BaseModel):
+    kind: str  # "player" or "team"
+    id: str
+    label: str
+    url: str
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class SearchIndex:
+    """
+    Maps every prefix of every name token (and of the full name) to the entries
+    containing it, so a lookup is a single dict access instead of a LIKE scan.
+
+    The ETL runs in a separate process, so the index checks the game count at
+    most once every `refresh_interval` seconds and rebuilds itself when new
+    games have been loaded.
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = 60.0):
+        self.refresh_interval = refresh_interval
+        self._prefixes: Dict[str, Set[int]] = defaultdict(set)
+        self._entries: List[SearchResult] = []
+        self._names: List[str] = []
+        self._game_count = None
+        self._last_checked = 0.0
+
+    def build(self, db: Session) -> None:
+        """
+        (Re)builds the index from the player and team tables.
+        """
+        entries = []
+        names = []
+        # Extra prefix tokens that are searchable but not part of the ranked name
+        aliases = []
+        for t in db.query(TeamORM).all():
+            entries.append(
+                SearchResult(
+                    kind="team",
+                    id=t.id,
+                    label=f"{t.city} {t.name}",
+                    url=f"/teams/{t.id}/view",
+                )
+            )
+            names.append(_normalize(f"{t.city} {t.name}"))
+            aliases.append({_normalize(t.abbreviation)})
+        for p in db.query(PlayerORM).all():
+            entries.append(
+                SearchResult(
+                    kind="player",
+                    id=p.id,
+                    label=f"{p.first_name} {p.last_name}",
+                    url=f"/players/{p.id}/view",
+                )
+            )
+            names.append(_normalize(f"{p.first_name} {p.last_name}"))
+            aliases.append(set())
+
+        prefixes = defaultdict(set)
+        for i, (name, alias) in enumerate(zip(names, aliases)):
+            for token in set(name.split()) | {name} | alias:
+                for end in range(1, len(token) + 1):
+                    prefixes[token[:end]].add(i)
+
+        # Swap in one step so concurrent lookups never see a half-built index
+        self._entries, self._names, self._prefixes = entries, names, prefixes
+        self._game_count = db.query(func.count(GameORM.id)).scalar()
+        self._last_checked = time.monotonic()
+
+    def refresh_if_stale(self, db: Session) -> None:
+        """
+        Rebuilds the index if games were loaded since it was last built.
+        """
+        now = time.monotonic()
+        if (
+            self._game_count is not None
+            and now - self._last_checked < self.refresh_interval
+        ):
+            return
+        self._last_checked = now
+        if db.query(func.count(GameORM.id)).scalar() != self._game_count:
+            self.build(db)
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[SearchResult]:
+        """
+        Returns entries matching every token of the query as a prefix, ranked
+        by exact match, then full-name prefix, then token prefix, then name.
+        """
+        query = _normalize(query)
+        if not query:
+            return []
+        tokens = query.split()
+        matches = set(self._prefixes.get(query, ()))
+        token_matches = set.intersection(
+            *(self._prefixes.get(token, set()) for token in tokens)
+        )
+        matches |= token_matches
+
+        def rank(i: int) -> tuple:
+            name = self._names[i]
+            return (
+                name != query,
+                not name.startswith(query),
+                self._entries[i].kind != "team",
+                name,
+            )
+
+        return [self._entries[i] for i in sorted(matches, key=rank)[:limit]]